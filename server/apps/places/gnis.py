@@ -0,0 +1,103 @@
+"""
+Parsing for USGS GNIS national file extracts.
+
+Kept free of Django imports so it can be run (and profiled) on its own,
+including under PyPy.
+"""
+import csv
+import logging
+import os
+from operator import itemgetter
+
+log = logging.getLogger(__name__)
+
+EXCLUDED_TYPES = frozenset((
+    "Airport", "Building", "Cemetery", "Crossing", "Locale", "Census",
+    "Church", "Civil", "Hospital", "Summit", "Tower", "Military", "Mine",
+    "School", "Post Office", "Tunnel", "Well"))
+
+GNIS_COLUMNS = ('FEATURE_CLASS', 'FEATURE_NAME', 'STATE_ALPHA',
+                'COUNTY_NAME', 'PRIM_LAT_DEC', 'PRIM_LONG_DEC')
+
+READ_BUFFER = 1 << 20
+# Size of the byte ranges handed to parse_gnis_chunk.
+CHUNK_SIZE = 8 << 20
+
+
+def _read_header(fh):
+    header = next(csv.reader([fh.readline()], delimiter='|',
+                             quoting=csv.QUOTE_NONE))
+    return [header.index(column) for column in GNIS_COLUMNS]
+
+
+def _lines(fh, end):
+    """Yield lines from fh's current position up to byte offset end."""
+    readline = fh.readline
+    pos = fh.tell()
+    while pos < end:
+        line = readline()
+        if not line:
+            break
+        pos += len(line)
+        yield line
+
+
+def _places(lines, indices, start):
+    # GNIS is plain pipe-delimited text; a stray '"' in a name must not
+    # start a quoted field that swallows the following lines.
+    reader = csv.reader(lines, delimiter='|', quoting=csv.QUOTE_NONE)
+    type_index = indices[0]
+    get_place = itemgetter(*indices)
+    # Hot loop: keep the global lookup out of it.
+    excluded = EXCLUDED_TYPES
+    for rows, row in enumerate(reader, 1):
+        try:
+            # Skip excluded features before doing any per-field work.
+            if row[type_index] in excluded:
+                continue
+            place = get_place(row)
+        except IndexError:
+            log.warning("Skipping malformed row %d after byte %d: %r",
+                        rows, start, row)
+            continue
+        yield place
+
+
+def parse_gnis(path):
+    """Yield (type, name, state, county, lat, lng) tuples from a GNIS file."""
+    with open(path, 'rb', READ_BUFFER) as fh:
+        indices = _read_header(fh)
+        for place in _places(fh, indices, fh.tell()):
+            yield place
+
+
+def split_gnis(path, chunk_size=CHUNK_SIZE):
+    """Split the data rows of a GNIS file into (path, start, end) ranges.
+
+    Every range starts at the beginning of a line, so each can be parsed
+    independently by parse_gnis_chunk.
+    """
+    size = os.path.getsize(path)
+    chunks = []
+    with open(path, 'rb') as fh:
+        fh.readline()
+        start = fh.tell()
+        while start < size:
+            fh.seek(min(start + chunk_size, size))
+            fh.readline()
+            end = fh.tell()
+            chunks.append((path, start, end))
+            start = end
+    return chunks
+
+
+def parse_gnis_chunk(chunk):
+    """Return the places in one (path, start, end) range from split_gnis.
+
+    Takes a single tuple so it can be mapped over a multiprocessing pool.
+    """
+    path, start, end = chunk
+    with open(path, 'rb', READ_BUFFER) as fh:
+        indices = _read_header(fh)
+        fh.seek(start)
+        return list(_places(_lines(fh, end), indices, start))
@@ -1,43 +1,230 @@
-from django.core.management.base import BaseCommand
+import gc
+import sys
+from cStringIO import StringIO
+from multiprocessing import Pool
+from optparse import make_option
+from Queue import Queue
+from threading import Thread
 
-from places.models import Place
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
 
+from places.gnis import parse_gnis, parse_gnis_chunk, split_gnis
 
-import csv
+BATCH_SIZE = 10000
+# Unique places collected before they are COPYed in.
+FLUSH_SIZE = 50000
+# Parsed batches waiting to be copied; bounds memory if the database
+# falls behind the parser.
+QUEUE_SIZE = 4
 
-excluded_types = ["Airport", "Building", "Cemetery", "Crossing", "Locale",
-                  "Census", "Church", "Civil", "Hospital", "Summit", "Tower",
-                  "Military", "Mine", "School", "Post Office", "Tunnel", "Well"]
+# Places that aren't in the table yet are COPYed straight into
+# places_place. Places that already exist are COPYed into a temporary
+# staging table and applied with a single UPDATE at the end of the load,
+# instead of a get_or_create + save round trip per row.
+COPY_COLUMNS = ('type', 'name', 'state', 'county', 'lat', 'lng')
+
+CREATE_STAGING = """
+    CREATE TEMPORARY TABLE places_place_staging (
+        id serial,
+        type varchar(254),
+        name varchar(254),
+        state varchar(2),
+        county varchar(254),
+        lat numeric(10, 7),
+        lng numeric(10, 7)
+    ) ON COMMIT DROP
+"""
+
+# The same place can show up in more than one flush; the first time it is
+# inserted and later ones are staged as updates. Keep the last one, which
+# is what the per-row loader used to end up with.
+DEDUPE_STAGING = """
+    DELETE FROM places_place_staging AS s
+    USING places_place_staging AS t
+    WHERE s.type = t.type AND s.name = t.name
+      AND s.state = t.state AND s.county = t.county
+      AND s.id < t.id
+"""
+
+# For an initial load the unique constraints are dropped and rebuilt
+# once at the end, rather than maintained row by row during the COPYs.
+UNIQUE_CONSTRAINTS = """
+    SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint
+    WHERE conrelid = 'places_place'::regclass AND contype = 'u'
+"""
+
+# Only rows whose coordinates actually changed are rewritten; on a
+# re-load most places are unchanged.
+UPDATE_PLACES = """
+    UPDATE places_place AS p
+    SET lat = s.lat, lng = s.lng
+    FROM places_place_staging AS s
+    WHERE p.type = s.type AND p.name = s.name
+      AND p.state = s.state AND p.county = s.county
+      AND (p.lat, p.lng) IS DISTINCT FROM (s.lat, s.lng)
+"""
+
+
+def _escape(value):
+    return (value.replace('\\', '\\\\').replace('\t', '\\t')
+                 .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+def read_batches(path, queue, errors, workers=1):
+    """Put lists of places on queue, then None.
+
+    Runs in its own thread so parsing overlaps with the COPYs, which
+    release the GIL while they wait on the database. With more than one
+    worker the file is split into byte ranges parsed by a process pool,
+    and each range's places go on the queue in file order. Anything
+    raised while parsing is stored in errors for the consumer to re-raise.
+    """
+    try:
+        if workers > 1:
+            pool = Pool(workers)
+            try:
+                for batch in pool.imap(parse_gnis_chunk, split_gnis(path)):
+                    queue.put(batch)
+            finally:
+                pool.terminate()
+            return
+
+        batch = []
+        append = batch.append
+        for place in parse_gnis(path):
+            append(place)
+            if len(batch) >= BATCH_SIZE:
+                queue.put(batch)
+                batch = []
+                append = batch.append
+        if batch:
+            queue.put(batch)
+    except Exception:
+        errors.append(sys.exc_info())
+    finally:
+        queue.put(None)
 
 
 class Command(BaseCommand):
     args = '<gnis text file>'
     help = 'Load places data'
+    option_list = BaseCommand.option_list + (
+        make_option('--initial',
+            action='store_true',
+            default=False,
+            help='Load into an empty table, building indexes at the end.'),
+        make_option('-w', '--workers',
+            action='store',
+            type='int',
+            default=1,
+            help='Number of processes to parse the file with.'),
+    )
+
+    def copy_rows(self, cursor, table, rows):
+        # Rows are written out directly in COPY's text format rather than
+        # through csv.writer. Backslashes, tabs and line breaks are
+        # escaped, and a missing coordinate is written as \N (NULL).
+        buf = StringIO()
+        write = buf.write
+        for type_, name, state, county, lat, lng in rows:
+            write('\t'.join((_escape(type_), _escape(name), _escape(state),
+                             _escape(county), lat or '\\N', lng or '\\N')))
+            write('\n')
+        buf.seek(0)
+        cursor.copy_from(buf, table, columns=COPY_COLUMNS)
+
+    def flush(self, cursor, pending, existing):
+        """COPY the pending places in and return how many were new."""
+        inserts = []
+        updates = []
+        insert = inserts.append
+        update = updates.append
+        add = existing.add
+        for key, coords in pending.iteritems():
+            if key in existing:
+                update(key + coords)
+            else:
+                add(key)
+                insert(key + coords)
+        if inserts:
+            self.copy_rows(cursor, 'places_place', inserts)
+        if updates:
+            self.copy_rows(cursor, 'places_place_staging', updates)
+        pending.clear()
+        gc.collect()
+        return len(inserts)
+
+    def existing_keys(self):
+        # A named (server-side) cursor streams the keys in FLUSH_SIZE
+        # chunks rather than buffering the whole table client-side.
+        cursor = connection.connection.cursor('places_place_keys')
+        cursor.itersize = FLUSH_SIZE
+        cursor.execute("SELECT type, name, state, county FROM places_place")
+        # psycopg2 hands back unicode; GNIS rows are UTF-8 byte strings.
+        keys = set(tuple(value.encode('utf-8') for value in key)
+                   for key in cursor)
+        cursor.close()
+        return keys
 
     def handle(self, *args, **options):
-        reader = csv.DictReader(open(args[0]), delimiter='|')
-        rows = 0
-        for row in reader:
-            #if rows > 1000:
-            #    break
-            try:
-                rows += 1
-                kwargs = {
-                    'type': row['FEATURE_CLASS'].decode("utf-8").encode('utf-8'),
-                    #'name': row['FEATURE_NAME'].decode("utf-8").encode('ascii', 'ignore'),
-                    'name': row['FEATURE_NAME'].decode("utf-8").encode('utf-8'),
-                    'state': row['STATE_ALPHA'].decode("utf-8").encode('utf-8'),
-                    'county': row['COUNTY_NAME'].decode("utf-8").encode('utf-8'),
-                    'lat': row['PRIM_LAT_DEC'].decode("utf-8").encode('utf-8'),
-                    'lng': row['PRIM_LONG_DEC'].decode("utf-8").encode('utf-8')
-                }
-
-                if kwargs['type'] not in excluded_types:
-                    place, created = Place.objects.get_or_create(type=kwargs['type'], name=kwargs['name'], state=kwargs['state'], county=kwargs['county'])
-                    place.lat = kwargs['lat']
-                    place.lng = kwargs['lng']
-                    place.save()
-            except:
-                import pdb
-                pdb.set_trace()
-        print Place.objects.all().count()
+        # Nothing the loader allocates forms reference cycles, but the
+        # millions of tuples it creates keep tripping the cyclic
+        # collector. Turn it off and collect once per flush instead.
+        gc.disable()
+        try:
+            inserted, updated = self.load(args[0], **options)
+        finally:
+            gc.enable()
+        print "%d places added, %d updated" % (inserted, updated)
+
+    def load(self, path, initial=False, workers=1, **options):
+        with transaction.commit_on_success():
+            cursor = connection.cursor()
+            # The whole load is one transaction; don't wait on the WAL
+            # flush for it. A crash just means re-running the load.
+            cursor.execute("SET LOCAL synchronous_commit TO OFF")
+            cursor.execute(CREATE_STAGING)
+            if initial:
+                cursor.execute("SELECT 1 FROM places_place LIMIT 1")
+                if cursor.fetchone() is not None:
+                    raise CommandError('--initial needs an empty places table.')
+                cursor.execute(UNIQUE_CONSTRAINTS)
+                constraints = cursor.fetchall()
+                for name, definition in constraints:
+                    cursor.execute('ALTER TABLE places_place DROP CONSTRAINT "%s"' % name)
+                existing = set()
+            else:
+                constraints = []
+                existing = self.existing_keys()
+
+            queue = Queue(QUEUE_SIZE)
+            errors = []
+            producer = Thread(target=read_batches,
+                              args=(path, queue, errors, workers))
+            producer.daemon = True
+            producer.start()
+
+            # The connection belongs to this thread, so all the COPYs
+            # happen here. Places are keyed on (type, name, state, county)
+            # so repeats within a flush collapse to the last coordinates
+            # before they reach the database.
+            pending = {}
+            inserted = 0
+            for batch in iter(queue.get, None):
+                for place in batch:
+                    pending[place[:4]] = place[4:]
+                if len(pending) >= FLUSH_SIZE:
+                    inserted += self.flush(cursor, pending, existing)
+            producer.join()
+            if errors:
+                exc_type, exc_value, tb = errors[0]
+                raise exc_type, exc_value, tb
+            inserted += self.flush(cursor, pending, existing)
+
+            cursor.execute(DEDUPE_STAGING)
+            cursor.execute(UPDATE_PLACES)
+            updated = cursor.rowcount
+            for name, definition in constraints:
+                cursor.execute('ALTER TABLE places_place ADD CONSTRAINT "%s" %s' % (name, definition))
+        return inserted, updated
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+import datetime
+from south.db import db
+from south.v2 import SchemaMigration
+from django.db import models
+
+
+class Migration(SchemaMigration):
+
+    def forwards(self, orm):
+        # Adding unique constraint on 'Place', fields ['type', 'name', 'state', 'county']
+        db.create_unique(u'places_place', ['type', 'name', 'state', 'county'])
+
+
+    def backwards(self, orm):
+        # Removing unique constraint on 'Place', fields ['type', 'name', 'state', 'county']
+        db.delete_unique(u'places_place', ['type', 'name', 'state', 'county'])
+
+
+    models = {
+        u'places.place': {
+            'Meta': {'unique_together': "(('type', 'name', 'state', 'county'),)", 'object_name': 'Place'},
+            'county': ('django.db.models.fields.CharField', [], {'max_length': '254'}),
+            u'id': ('django.db.models.fields.AutoField', [], {'primary_key': 'True'}),
+            'lat': ('django.db.models.fields.DecimalField', [], {'null': 'True', 'max_digits': '10', 'decimal_places': '7', 'blank': 'True'}),
+            'lng': ('django.db.models.fields.DecimalField', [], {'null': 'True', 'max_digits': '10', 'decimal_places': '7', 'blank': 'True'}),
+            'name': ('django.db.models.fields.CharField', [], {'max_length': '254'}),
+            'state': ('django.db.models.fields.CharField', [], {'max_length': '2'}),
+            'type': ('django.db.models.fields.CharField', [], {'max_length': '254'})
+        }
+    }
+
+    complete_apps = ['places']
@@ -14,5 +14,8 @@ class Place(caching.base.CachingMixin, models.Model):
 
     objects = caching.base.CachingManager()
 
+    class Meta:
+        unique_together = (('type', 'name', 'state', 'county'),)
+
     def __unicode__(self):
         return "%s: %s, %s (%s)" % (self.name, self.state, self.county, self.type)
@@ -0,0 +1,61 @@
+import os
+import shutil
+import tempfile
+
+from django.test import SimpleTestCase
+
+from .gnis import parse_gnis, parse_gnis_chunk, split_gnis
+
+# Columns in a different order from GNIS_COLUMNS, plus ones that aren't
+# used, so the header lookup is exercised too.
+GNIS_TEXT = (
+    'FEATURE_ID|FEATURE_NAME|FEATURE_CLASS|STATE_ALPHA|COUNTY_NAME|PRIM_LAT_DEC|PRIM_LONG_DEC\n'
+    '1|Coral Bay|Bay|VI|St. John|18.3458|-64.7125\n'
+    '8|"Big Rock|Pillar|VI|St. Thomas|18.3100|-64.9500\n'
+    '2|Cruz Bay School|School|VI|St. John|18.3311|-64.7944\n'
+    '3|short|row\n'
+    '4|Caf\xc3\xa9 Point|Cape|PR|Culebra|18.3000|-65.3000\n'
+    '5|Nowhere Reef|Bar|VI|St. Croix||\n'
+    '6|St. Croix Airport|Airport|VI|St. Croix|17.7019|-64.7986\n'
+    '7|Buck Island|Island|VI|St. Croix|17.7886|-64.6214\n'
+)
+
+EXPECTED = [
+    ('Bay', 'Coral Bay', 'VI', 'St. John', '18.3458', '-64.7125'),
+    # A stray quote is just part of the name.
+    ('Pillar', '"Big Rock', 'VI', 'St. Thomas', '18.3100', '-64.9500'),
+    ('Cape', 'Caf\xc3\xa9 Point', 'PR', 'Culebra', '18.3000', '-65.3000'),
+    ('Bar', 'Nowhere Reef', 'VI', 'St. Croix', '', ''),
+    ('Island', 'Buck Island', 'VI', 'St. Croix', '17.7886', '-64.6214'),
+]
+
+
+class TestGnis(SimpleTestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'gnis.txt')
+        with open(self.path, 'wb') as fh:
+            fh.write(GNIS_TEXT)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_parse_skips_excluded_and_malformed_rows(self):
+        self.assertEqual(list(parse_gnis(self.path)), EXPECTED)
+
+    def test_chunks_cover_the_data_rows(self):
+        header_size = len(GNIS_TEXT.split('\n', 1)[0]) + 1
+        for chunk_size in (1, 10, 50, len(GNIS_TEXT) * 2):
+            chunks = split_gnis(self.path, chunk_size)
+            self.assertEqual(chunks[0][1], header_size)
+            self.assertEqual(chunks[-1][2], len(GNIS_TEXT))
+            for (_, _, end), (_, start, _) in zip(chunks, chunks[1:]):
+                self.assertEqual(end, start)
+
+    def test_chunked_parse_matches_parse(self):
+        for chunk_size in (1, 10, 50, len(GNIS_TEXT) * 2):
+            places = []
+            for chunk in split_gnis(self.path, chunk_size):
+                places.extend(parse_gnis_chunk(chunk))
+            self.assertEqual(places, EXPECTED, 'chunk size %d' % chunk_size)
@@ -12,7 +12,7 @@ from django.shortcuts import get_object_or_404
 
 from ordereddict import OrderedDict
 
-from apps.survey.models import Survey, Question, Response, Respondant, LocationAnswer, GridAnswer, MultiAnswer
+from apps.survey.models import Survey, Question, Response, Respondant, LocationAnswer, GridAnswer, MultiAnswer, NUMBER_TYPES
 from .decorators import api_user_passes_test
 from .forms import APIFilterForm, GridStandardDeviationForm, SurveyorStatsForm
 from .utils import SlugCSVWriter
@@ -38,7 +38,10 @@ def get_geojson(request, survey_slug, question_slug):
             slug = filter.keys()[0]
             value = filter[slug]
             filter_question = Question.objects.get(slug=slug, survey=survey)
-            locations = locations.filter(location__respondant__response_set__in=filter_question.response_set.filter(answer__in=value))
+            matching = (filter_question.response_set
+                                       .filter(answer__in=value)
+                                       .values('respondant'))
+            locations = locations.filter(location__respondant__in=matching)
 
     geojson = []
     for location in locations:
@@ -159,7 +162,7 @@ def _get_crosstab(filters, survey_slug, question_a_slug, question_b_slug):
                     'name': question_a_answer['answer'],
                     'value': list(rows)
                 })
-            elif question_b.type in ['currency', 'integer', 'number']:
+            elif question_b.type in NUMBER_TYPES:
                 if group is None:
                     obj['type'] = 'bar-chart'
                     d = {
@@ -628,6 +631,12 @@ def full_data_dump_csv(request, survey_slug):
 
     writer = SlugCSVWriter(response, fields)
     writer.writeheader()
-    for resp in survey.respondant_set.all():
-        writer.writerow(json.loads(resp.csv_row.json_data))
+    # Only the stored JSON is needed, so read it in the same query rather
+    # than loading each respondant and then its CSVRow.
+    rows = (survey.respondant_set.no_cache()
+                                 .exclude(csv_row__json_data=None)
+                                 .values_list('csv_row__json_data', flat=True)
+                                 .iterator())
+    for json_data in rows:
+        writer.writerow(json.loads(json_data))
     return response
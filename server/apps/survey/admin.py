@@ -26,6 +26,11 @@ class QuestionAdmin(admin.ModelAdmin):
     prepopulated_fields = {'slug': ('label',), 'info': ('label',)}
     list_display = ('survey_slug', 'slug', 'type', 'title')
 
+    def queryset(self, request):
+        # survey_slug is shown for every row.
+        return (super(QuestionAdmin, self).queryset(request)
+                .prefetch_related('survey_set', 'modal_question__survey_set'))
+
     def formfield_for_manytomany(self, db_field, request, **kwargs):
         if db_field.name == "blocks":
             kwargs["queryset"] = Block.objects.all().order_by('name')
@@ -88,6 +88,14 @@ class OfflineResponseResource(AuthSurveyModelResource):
     class Meta(AuthSurveyModelResource.Meta):
         queryset = Response.objects.all()
 
+    def hydrate(self, bundle):
+        # Responses uploaded inside an offline respondant leave the CSV
+        # row to OfflineRespondantResource, which rebuilds it once all of
+        # them are saved. Responses posted on their own rebuild it as usual.
+        if bundle.related_obj is not None:
+            bundle.obj.update_csv = False
+        return bundle
+
 
 class OfflineRespondantResource(AuthSurveyModelResource):
     responses = fields.ToManyField(OfflineResponseResource, 'response_set', null=True, blank=True)
@@ -99,7 +107,14 @@ class OfflineRespondantResource(AuthSurveyModelResource):
         ordering = ['-ts']
 
     def obj_create(self, bundle, **kwargs):
-        return super(OfflineRespondantResource, self).obj_create(bundle, surveyor=bundle.request.user)
+        bundle = super(OfflineRespondantResource, self).obj_create(bundle, surveyor=bundle.request.user)
+        bundle.obj.update_csv_row()
+        return bundle
+
+    def obj_update(self, bundle, **kwargs):
+        bundle = super(OfflineRespondantResource, self).obj_update(bundle, **kwargs)
+        bundle.obj.update_csv_row()
+        return bundle
 
     def save_related(self, bundle):
         resource_uri = self.get_resource_uri(bundle.obj)
@@ -1,6 +1,6 @@
 from django.core.management.base import BaseCommand
 from optparse import make_option
-from survey.models import Response
+from survey.models import Respondant, Response
 
 
 class Command(BaseCommand):
@@ -20,14 +20,23 @@ class Command(BaseCommand):
         #for response in Response.objects.all():
         white_space = options.get('white_space')
         question_id = options.get('question_id')
-        responses = Response.objects.all().order_by('-id')
+        responses = Response.objects_nocache.all().order_by('-id')
         if question_id:
             responses = responses.filter(question__id=question_id)
         if white_space:
             responses = responses.filter(answer__contains="\r")
         print "Saving Answers for %s Responses" % responses.count()
-        for response in responses:
+        respondant_ids = set()
+        for response in responses.iterator():
             try:
-                response.save_related()
+                response.save_related(update_csv=False)
             except:
                 pass
+            else:
+                respondant_ids.add(response.respondant_id)
+        respondant_ids.discard(None)
+        # One CSV row rebuild per respondant, not one per response.
+        print "Updating CSV rows for %s Respondants" % len(respondant_ids)
+        respondants = Respondant.objects.no_cache().filter(pk__in=respondant_ids)
+        for respondant in respondants.iterator():
+            respondant.update_csv_row()
@@ -1,9 +1,12 @@
 from decimal import Decimal
 from django.contrib.auth.models import User
-from django.db import models
+from django.core.cache import cache
+from django.db import connections, models
 from django.db.models import Max, Min, Count, Sum
 from django.db.models import signals
-from django.utils.timezone import utc
+from django.utils import timezone
+from django.utils.encoding import force_text
+from django.utils.functional import cached_property
 
 import datetime
 import uuid
@@ -12,6 +15,20 @@ import caching.base
 
 from ordereddict import OrderedDict
 
+# Rows per INSERT when save_related bulk creates answer rows.
+BULK_BATCH_SIZE = 500
+
+FIELD_NAMES_KEY = 'survey-fields-%s'
+FIELD_NAMES_TIMEOUT = 60 * 60
+
+# Keyed by survey and day, so the "today" count rolls over at midnight.
+STATS_KEY = 'survey-stats-%s-%s'
+STATS_TIMEOUT = 5 * 60
+
+# Turns a grid row into the slug used in its field name.
+ROW_SLUG_TRANSLATION = {ord(u' '): u'-', ord(u'('): None, ord(u')'): None,
+                        ord(u'/'): None}
+
 
 def make_uuid():
     return str(uuid.uuid4())
@@ -30,6 +47,7 @@ REVIEW_STATE_CHOICES = (
     (REVIEW_STATE_FLAGGED, u'Flagged'),
     (REVIEW_STATE_ACCEPTED, u'Accepted')
 )
+REVIEW_STATE_LABELS = dict(REVIEW_STATE_CHOICES)
 
 
 class Respondant(caching.base.CachingMixin, models.Model):
@@ -44,7 +62,7 @@ class Respondant(caching.base.CachingMixin, models.Model):
     last_question = models.CharField(max_length=240, null=True, blank=True)
 
     vendor = models.CharField(max_length=240, null=True, blank=True)
-    survey_site = models.CharField(max_length=240, null=True, blank=True)
+    survey_site = models.CharField(max_length=240, null=True, blank=True, db_index=True)
     buy_or_catch = models.CharField(max_length=240, null=True, blank=True)
     how_sold = models.CharField(max_length=240, null=True, blank=True)
 
@@ -61,6 +79,13 @@ class Respondant(caching.base.CachingMixin, models.Model):
 
     objects = caching.base.CachingManager()
 
+    class Meta:
+        # Matches the filters in stats_report_filter and the dashboard.
+        index_together = [
+            ['survey', 'ts'],
+            ['survey', 'review_status'],
+        ]
+
     def __unicode__(self):
         if self.email:
             return "%s" % self.email
@@ -68,20 +93,24 @@ class Respondant(caching.base.CachingMixin, models.Model):
             return "%s" % self.uuid
 
     def save(self, *args, **kwargs):
+        # Callers that rebuild the CSV row themselves once they're done
+        # (see Response.save_related) pass update_csv=False.
+        update_csv = kwargs.pop('update_csv', True)
         if self.uuid and ":" in self.uuid:
             self.uuid = self.uuid.replace(":", "_")
         if not self.ts:
-            self.ts = datetime.datetime.utcnow().replace(tzinfo=utc)
-        self.locations = self.location_set.all().count()
+            self.ts = timezone.now()
+        self.locations = self.location_set.count()
 
-        if not self.csv_row:
+        if not self.csv_row_id:
             # Circular import dodging
             from apps.reports.models import CSVRow
             self.csv_row = CSVRow.objects.create()
         super(Respondant, self).save(*args, **kwargs)
         # Do this after saving so save_related is called to catch
         # all the updated responses.
-        self.update_csv_row()
+        if update_csv:
+            self.update_csv_row()
 
     def update_csv_row(self):
         self.csv_row.json_data = simplejson.dumps(self.generate_flat_dict())
@@ -103,13 +132,22 @@ class Respondant(caching.base.CachingMixin, models.Model):
             'model-timestamp': str(self.ts),
             'model-email': self.email,
             'model-complete': self.complete,
-            'model-review-status': self.get_review_status_display(),
+            # Same as get_review_status_display(), without rebuilding the
+            # choices dict for every row.
+            'model-review-status': REVIEW_STATE_LABELS.get(self.review_status, self.review_status),
         }
 
-        for response in self.response_set.all().select_related('question'):
+        for response in self._fetch_responses():
             flat.update(response.generate_flat_dict())
         return flat
 
+    def _fetch_responses(self):
+        # Grid answers are prefetched in one query rather than one per
+        # grid response in Response.generate_flat_dict. Responses carry
+        # their question's type and slug, so the question isn't joined.
+        return (Response.objects_nocache.filter(respondant=self)
+                                        .prefetch_related('gridanswer_set'))
+
     @classmethod
     def stats_report_filter(cls, survey_slug, start_date=None,
                             end_date=None, market=None, surveyor=None,
@@ -164,53 +202,98 @@ class Survey(caching.base.CachingMixin, models.Model):
 
     objects = caching.base.CachingManager()
 
+    def dashboard_stats(self):
+        """Respondant counts for the dashboard from a single grouped query."""
+        today = timezone.make_aware(
+            datetime.datetime.combine(datetime.date.today(),
+                                      datetime.datetime.min.time()),
+            timezone.get_default_timezone())
+        tomorrow = today + datetime.timedelta(days=1)
+        groups = (self.respondant_set
+                      .extra(select={'today': 'survey_respondant.ts >= %s AND survey_respondant.ts < %s'},
+                             select_params=(today, tomorrow))
+                      .values('complete', 'review_status', 'today')
+                      .annotate(count=Count('pk')))
+
+        stats = dict.fromkeys(('survey_responses', 'completes',
+                               'reviews_needed', 'flagged', 'today'), 0)
+        for group in groups:
+            count = group['count']
+            stats['survey_responses'] += count
+            if group['complete']:
+                stats['completes'] += count
+            if group['review_status'] == REVIEW_STATE_NEEDED:
+                stats['reviews_needed'] += count
+            elif group['review_status'] == REVIEW_STATE_FLAGGED:
+                stats['flagged'] += count
+            if group['today']:
+                stats['today'] += count
+        return stats
+
+    @cached_property
+    def _stats(self):
+        # Cleared by clear_survey_stats when a respondant changes.
+        key = STATS_KEY % (self.pk, datetime.date.today())
+        stats = cache.get(key)
+        if stats is None:
+            stats = self.dashboard_stats()
+            cache.set(key, stats, STATS_TIMEOUT)
+        return stats
+
     @property
     def survey_responses(self):
-        return self.respondant_set.all().count()
+        return self._stats['survey_responses']
 
     @property
     def completes(self):
-        return self.respondant_set.filter(complete=True).count()
+        return self._stats['completes']
 
     @property
     def reviews_needed(self):
-        return self.respondant_set.filter(review_status=REVIEW_STATE_NEEDED).count()
+        return self._stats['reviews_needed']
 
     @property
     def flagged(self):
-        return self.respondant_set.filter(review_status=REVIEW_STATE_FLAGGED).count()
+        return self._stats['flagged']
 
     @property
     def activity_points(self):
         return Location.objects.filter(response__respondant__in=self.respondant_set.filter(complete=True)).count()
 
+    @cached_property
+    def _ts_extent(self):
+        return self.respondant_set.all().aggregate(lowest=Min('ts'), highest=Max('ts'))
+
     @property
     def response_date_start(self):
         #return self.questions.filter(slug='survey-date').aggregate(date=Min('response__answer_date')).get('date', None)
-        return self.respondant_set.all().aggregate(lowest=Min('ts'), highest=Max('ts'))['lowest']
+        return self._ts_extent['lowest']
 
     @property
     def response_date_end(self):
         #return self.questions.filter(slug='survey-date').aggregate(date=Max('response__answer_date')).get('date', None)
-        return self.respondant_set.all().aggregate(lowest=Min('ts'), highest=Max('ts'))['highest']
+        return self._ts_extent['highest']
 
     @property
     def today(self):
-        today = datetime.datetime.combine(datetime.date.today(),
-                                          datetime.datetime.min.time())
-        tomorrow = today + datetime.timedelta(days=1)
-        return self.respondant_set.filter(ts__gte=today, ts__lt=tomorrow).count()
+        return self._stats['today']
 
     def generate_field_names(self):
+        # Cleared by clear_field_names when the survey's questions change.
+        key = FIELD_NAMES_KEY % self.pk
+        fields = cache.get(key)
+        if fields is None:
+            fields = self._generate_field_names()
+            cache.set(key, fields, FIELD_NAMES_TIMEOUT)
+        return fields
+
+    def _generate_field_names(self):
         fields = OrderedDict()
         for q in self.questions.all().order_by('order'):
             if q.type == 'grid':
                 if q.rows:
                     for row in q.rows.splitlines():
-                        row_slug = (row.lower().replace(' ', '-')
-                                               .replace('(', '')
-                                               .replace(')', '')
-                                               .replace('/', ''))
+                        row_slug = force_text(row).lower().translate(ROW_SLUG_TRANSLATION)
                         field_slug = q.slug + '-' + row_slug
                         field_name = q.label + ' - ' + row
                         fields[field_slug] = field_name
@@ -324,7 +407,7 @@ class Question(caching.base.CachingMixin, models.Model):
     def answer_domain(self):
         if self.visualize or self.filterBy:
             answers = self.response_set.all()  # self.response_set.filter(respondant__complete=True)
-            if self.type in ['map-multipoint']:
+            if self.type == 'map-multipoint':
                 return LocationAnswer.objects.filter(location__response__in=answers).values('answer').annotate(locations=Count('answer'), surveys=Count('location__respondant', distinct=True))
             else:
                 return answers.values('answer').annotate(locations=Sum('respondant__locations'), surveys=Count('answer'))
@@ -335,18 +418,37 @@ class Question(caching.base.CachingMixin, models.Model):
 
     def save(self, *args, **kwargs):
         super(Question, self).save(*args, **kwargs)
+        # Keep the copies on this question's responses in step.
+        (self.response_set.exclude(question_type=self.type, question_slug=self.slug)
+                          .update(question_type=self.type, question_slug=self.slug))
+        self.clear_field_names()
+
+    def clear_field_names(self):
+        """Drop the cached field names of every survey using this question."""
+        survey_ids = self.survey_set.values_list('pk', flat=True)
+        cache.delete_many([FIELD_NAMES_KEY % pk for pk in survey_ids])
 
     class Meta:
         ordering = ['order']
 
     @property
     def survey_slug(self):
-        if self.survey_set.all():
-            return self.survey_set.all()[0].slug
-        elif self.modal_question.all():
-            return self.modal_question.all()[0].survey_set.all()[0].slug + " (modal)"
-        else:
-            return "NA"
+        # Kept on the instance; __unicode__ and the admin changelist ask
+        # for it repeatedly.
+        if not hasattr(self, '_survey_slug'):
+            self._survey_slug = self._find_survey_slug()
+        return self._survey_slug
+
+    def _find_survey_slug(self):
+        # Slicing reads one row, or uses prefetch_related's cache if the
+        # caller prefetched survey_set / modal_question__survey_set.
+        surveys = self.survey_set.all()[:1]
+        if surveys:
+            return surveys[0].slug
+        modals = self.modal_question.all()[:1]
+        if modals:
+            return modals[0].survey_set.all()[0].slug + " (modal)"
+        return "NA"
 
     @property
     def question_types(self):
@@ -358,25 +460,29 @@ class Question(caching.base.CachingMixin, models.Model):
 
     def get_answer_domain(self, survey, filters=None):
         answers = self.response_set.all()  # self.response_set.filter(respondant__complete=True)
-        if self.type in ['map-multipoint']:
-            locations = LocationAnswer.objects.filter(location__response__in=answers)
+        location_values = []
         if filters is not None:
             for filter in filters:
                 slug = filter.keys()[0]
                 value = filter[slug]
                 filter_question = Question.objects.get(slug=slug, survey=survey)
 
-                if self.type in ['map-multipoint']:
-                    if filter_question == self:
-                        locations = locations.filter(answer__in=value)
-                    else:
-                        answers = answers.filter(respondant__response_set__in=filter_question.response_set.filter(answer__in=value))
-                        locations = locations.filter(location__response__in=answers)
+                if self.type == 'map-multipoint' and filter_question == self:
+                    location_values.append(value)
                 else:
-                    answers = answers.filter(respondant__responses__in=filter_question.response_set.filter(answer__in=value))
-        if self.type in ['map-multipoint']:
+                    # Restrict to respondants who gave one of the values,
+                    # as an IN (SELECT respondant_id ...) semi-join so a
+                    # respondant never fans out into duplicate rows.
+                    matching = (filter_question.response_set
+                                               .filter(answer__in=value)
+                                               .values('respondant'))
+                    answers = answers.filter(respondant__in=matching)
+        if self.type == 'map-multipoint':
+            locations = LocationAnswer.objects.filter(location__response__in=answers)
+            for value in location_values:
+                locations = locations.filter(answer__in=value)
             return locations.values('answer', 'location__lat', 'location__lng').annotate(locations=Count('answer'), surveys=Count('location__respondant', distinct=True))
-        elif self.type in ['multi-select']:
+        elif self.type == 'multi-select':
             return (MultiAnswer.objects.filter(response__in=answers)
                                        .values('answer_text')
                                        .annotate(surveys=Count('answer_text')))
@@ -429,6 +535,10 @@ class GridAnswer(caching.base.CachingMixin, models.Model):
 
 class Response(caching.base.CachingMixin, models.Model):
     question = models.ForeignKey(Question)
+    # Copied from question in save() (and by Question.save) so flattening
+    # a response doesn't need the question.
+    question_type = models.CharField(max_length=20, null=True, blank=True, db_index=True)
+    question_slug = models.SlugField(max_length=64, null=True, blank=True)
     respondant = models.ForeignKey(Respondant, null=True, blank=True)
     answer = models.TextField(null=True, blank=True)
     answer_number = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
@@ -437,130 +547,185 @@ class Response(caching.base.CachingMixin, models.Model):
     ts = models.DateTimeField()
     updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
     objects = caching.base.CachingManager()
+    # For reads that walk lots of responses once (CSV rows, re-saving
+    # answers), where caching every row would only churn the cache.
+    objects_nocache = models.Manager()
+
+    # Cleared on responses saved in bulk; the caller then rebuilds each
+    # respondant's CSV row once, after all of its responses are in.
+    update_csv = True
 
     def save(self, *args, **kwargs):
         if not self.ts:
-            self.ts = datetime.datetime.utcnow().replace(tzinfo=utc)
+            self.ts = timezone.now()
+        self.question_type = self.question.type
+        self.question_slug = self.question.slug
+        created = self.pk is None
         super(Response, self).save(*args, **kwargs)
+        # Save the related objects on initial creation. save_related saves
+        # this response again, but by then it has a pk.
+        if created:
+            self.save_related(update_csv=self.update_csv)
 
     def generate_flat_dict(self):
-        flat = {}
         if self.answer_raw:
-            if self.question.type in ('info', 'text', 'textarea', 'yes-no',
-                                      'single-select', 'auto-single-select',
-                                      'map-multipoint', 'pennies', 'timepicker', 'multi-select'):
-                flat[self.question.slug] = self.answer
-            elif self.question.type in ('currency', 'integer', 'number'):
-                flat[self.question.slug] = str(self.answer_number)
-            elif self.question.type == 'datepicker':
-                flat[self.question.slug] = self.answer_date.strftime('%m/%d/%Y')
-            elif self.question.type == 'grid':
-                for answer in self.gridanswer_set.all():
-                    flat[self.question.slug + '-' + answer.row_label] = answer.answer_text
-            else:
+            if self.question_type is None:
+                # Rows loaded without save(), e.g. from fixtures.
+                self.question_type = self.question.type
+                self.question_slug = self.question.slug
+            handler = FLAT_HANDLERS.get(self.question_type)
+            if handler is None:
                 raise NotImplementedError(
                     ('Found unknown question type of {0} while processing '
-                     'response id {1}').format(self.question.type, self.id)
+                     'response id {1}').format(self.question_type, self.id)
                 )
-            return flat
+            return handler(self)
 
-    def save_related(self):
+    def _flat_answer(self):
+        return {self.question_slug: self.answer}
+
+    def _flat_number(self):
+        return {self.question_slug: str(self.answer_number)}
+
+    def _flat_date(self):
+        return {self.question_slug: self.answer_date.strftime('%m/%d/%Y')}
+
+    def _flat_grid(self):
+        flat = {}
+        for answer in self.gridanswer_set.all():
+            flat[self.question_slug + '-' + answer.row_label] = answer.answer_text
+        return flat
+
+    def save_locations(self):
+        """Replace this response's map points and return their summaries."""
+        # LocationAnswers cascade, so this has to be a collecting delete,
+        # but the rows it loads don't need to be cached.
+        Location.objects.no_cache().filter(response=self).delete()
+        # Map answers arrive double encoded; save_related has already
+        # decoded the outer layer into self.answer.
+        points = simplejson.loads(self.answer)
+        Location.objects.bulk_create([
+            Location(lat=Decimal(str(point['lat'])), lng=Decimal(str(point['lng'])), response=self, respondant=self.respondant)
+            for point in points], batch_size=BULK_BATCH_SIZE)
+        # bulk_create doesn't set primary keys, so read them back. They
+        # come out in insert order, which is the order of the points.
+        locations = (Location.objects.no_cache()
+                                     .filter(response=self)
+                                     .order_by('pk'))
+        location_answers = []
+        for location, point in zip(locations, points):
+            for answer in point['answers'][0]:
+                location_answers.append(LocationAnswer(answer=answer['text'], label=answer['label'], location=location))
+        LocationAnswer.objects.bulk_create(location_answers, batch_size=BULK_BATCH_SIZE)
+        return ["%s,%s: %s" % (point['lat'], point['lng'], point['answers'])
+                for point in points]
+
+    def save_related(self, update_csv=True):
         if self.answer_raw:
             self.answer = simplejson.loads(self.answer_raw)
-            if self.question.type in ['datepicker']:
-                self.answer_date = datetime.datetime.strptime(self.answer, '%m/%d/%Y')
-            elif self.question.type in ['currency', 'integer', 'number']:
-                if isinstance(self.answer, (int, long, float, complex)):
-                    self.answer_number = self.answer
-                else:
-                    self.answer = None
-            elif self.question.type in ['auto-single-select', 'single-select', 'yes-no']:
-
-                answer = simplejson.loads(self.answer_raw)
-                if answer.get('name'):
-                    self.answer = answer['name'].strip()
-                elif answer.get('text'):
-                    self.answer = answer['text'].strip()
-            elif self.question.type in ['auto-multi-select', 'multi-select']:
-                answers = []
-                self.multianswer_set.all().delete()
-                for answer in simplejson.loads(self.answer_raw):
-                    if answer.get('name'):
-                        answer_text = answer['name'].strip()
-                    elif answer.get('text'):
-                        answer_text = answer['text'].strip()
-                    answers.append(answer_text)
-                    answer_label = answer.get('label', None)
-                    multi_answer = MultiAnswer(response=self, answer_text=answer_text, answer_label=answer_label)
-                    multi_answer.save()
-                self.answer = ", ".join(answers)
-            elif self.question.type in ['map-multipoint'] and self.id:
-                answers = []
-                self.location_set.all().delete()
-                for point in simplejson.loads(simplejson.loads(self.answer_raw)):
-                    answers.append("%s,%s: %s" % (point['lat'], point['lng'], point['answers']))
-                    location = Location(lat=Decimal(str(point['lat'])), lng=Decimal(str(point['lng'])), response=self, respondant=self.respondant)
-                    location.save()
-                    for answer in point['answers'][0]:
-                        answer = LocationAnswer(answer=answer['text'], label=answer['label'], location=location)
-                        answer.save()
-                    location.save()
-                self.answer = ", ".join(answers)
-            elif self.question.type in ['pennies'] and self.id:
-                answers = []
-                self.location_set.all().delete()
-                for point in simplejson.loads(simplejson.loads(self.answer_raw)):
-                    answers.append("%s,%s: %s" % (point['lat'], point['lng'], point['answers']))
-                    location = Location(lat=Decimal(str(point['lat'])), lng=Decimal(str(point['lng'])), response=self, respondant=self.respondant)
-                    location.save()
-                    for answer in point['answers'][0]:
-                        answer = LocationAnswer(answer=answer['text'], label=answer['label'], location=location)
-                        answer.save()
-                    location.save()
-                self.answer = ", ".join(answers)
-            elif self.question.type == 'grid':
-                self.gridanswer_set.all().delete()
-                for answer in self.answer:
-                    for grid_col in self.question.grid_cols.all():
-                        if grid_col.type in ['currency', 'integer', 'number', 'single-select', 'text', 'yes-no']:
-                            try:
-                                grid_answer = GridAnswer(response=self,
-                                    answer_text=answer[grid_col.label.replace('-', '')],
-                                    answer_number=answer[grid_col.label.replace('-', '')],
-                                    row_label=answer['label'], row_text=answer['text'],
-                                    col_label=grid_col.label, col_text=grid_col.text)
-                                grid_answer.save()
-                            except Exception as e:
-                                print "problem with %s in response id %s" % (grid_col.label, self.id)
-                                print "not found in", self.answer_raw
-                                print e
-
-                        elif grid_col.type == 'multi-select':
-                            try:
-                                for this_answer in answer[grid_col.label.replace('-', '')]:
-                                    print this_answer
-                                    grid_answer = GridAnswer(response=self,
-                                        answer_text=this_answer,
-                                        row_label=answer['label'], row_text=answer['text'],
-                                        col_label=grid_col.label, col_text=grid_col.text)
-                                    grid_answer.save()
-                            except:
-                                print "problem with ", answer
-                                print e
-                        else:
-                            print grid_col.type
-                            print answer
+            handler = SAVE_HANDLERS.get(self.question.type)
+            if handler is not None:
+                handler(self)
             question_slug = self.question.slug.replace('-', '_')
+            self.save()
+            fields = {}
             if hasattr(self.respondant, question_slug):
+                fields[question_slug] = self.answer
+            if self.question.type in MAP_TYPES and self.respondant_id is not None:
+                # Respondant.save isn't run, so keep its count current.
+                fields['locations'] = self.respondant.location_set.count()
+            if fields:
                 # Switched to filter and update rather than just modifying and
                 # saving. This doesn't trigger post_save, but still updates
                 # self.respondant and the related CSVRow object.
                 (Respondant.objects.filter(pk=self.respondant.pk)
-                                   .update(**{question_slug: self.answer}))
-                setattr(self.respondant, question_slug, self.answer)
-                self.respondant.save()
+                                   .update(**fields))
+                # update() skips post_save, so drop cached copies by hand.
+                Respondant.objects.invalidate(self.respondant)
+                for field, value in fields.items():
+                    setattr(self.respondant, field, value)
+            if update_csv and self.respondant_id is not None:
                 self.respondant.update_csv_row()
-            self.save()
+
+    def _save_date(self):
+        self.answer_date = datetime.datetime.strptime(self.answer, '%m/%d/%Y')
+
+    def _save_number(self):
+        if isinstance(self.answer, (int, long, float, complex)):
+            self.answer_number = self.answer
+        else:
+            self.answer = None
+
+    def _save_single_select(self):
+        answer = self.answer
+        if answer.get('name'):
+            self.answer = answer['name'].strip()
+        elif answer.get('text'):
+            self.answer = answer['text'].strip()
+
+    def _save_multi_select(self):
+        texts = [(answer.get('name') or answer.get('text') or '').strip()
+                 for answer in self.answer]
+        # Nothing points at these rows, so a single DELETE will do;
+        # _raw_delete doesn't load them or send signals.
+        MultiAnswer.objects.filter(response=self)._raw_delete(self._state.db)
+        MultiAnswer.objects.bulk_create([
+            MultiAnswer(response=self, answer_text=text, answer_label=answer.get('label'))
+            for text, answer in zip(texts, self.answer)], batch_size=BULK_BATCH_SIZE)
+        self.answer = ", ".join(texts)
+
+    def _save_map(self):
+        if self.id:
+            self.answer = ", ".join(self.save_locations())
+
+    def _save_grid(self):
+        GridAnswer.objects.filter(response=self)._raw_delete(self._state.db)
+        grid_answers = []
+        # Each number gets the same prep save() gave it (parsing, and
+        # fitting max_digits/decimal_places) up front, so a bad number
+        # still only drops its own cell rather than failing bulk_create.
+        answer_number = GridAnswer._meta.get_field('answer_number')
+        connection = connections[self._state.db]
+        # The columns are the same for every row; fetch them once, along
+        # with the key each one's value is stored under in a row.
+        grid_cols = [(grid_col, grid_col.label.replace('-', ''))
+                     for grid_col in self.question.grid_cols.all()]
+        for answer in self.answer:
+            for grid_col, col_key in grid_cols:
+                if grid_col.type in GRID_VALUE_TYPES:
+                    try:
+                        answer_number.get_db_prep_save(answer[col_key], connection)
+                        grid_answer = GridAnswer(response=self,
+                            answer_text=answer[col_key],
+                            answer_number=answer_number.to_python(answer[col_key]),
+                            row_label=answer['label'], row_text=answer['text'],
+                            col_label=grid_col.label, col_text=grid_col.text)
+                        grid_answers.append(grid_answer)
+                    except Exception as e:
+                        print "problem with %s in response id %s" % (grid_col.label, self.id)
+                        print "not found in", self.answer_raw
+                        print e
+
+                elif grid_col.type == 'multi-select':
+                    try:
+                        for this_answer in answer[col_key]:
+                            print this_answer
+                            grid_answer = GridAnswer(response=self,
+                                answer_text=this_answer,
+                                row_label=answer['label'], row_text=answer['text'],
+                                col_label=grid_col.label, col_text=grid_col.text)
+                            grid_answers.append(grid_answer)
+                    except:
+                        print "problem with ", answer
+                        print e
+                else:
+                    print grid_col.type
+                    print answer
+        GridAnswer.objects.bulk_create(grid_answers, batch_size=BULK_BATCH_SIZE)
+        if not self.question.rows:
+            # Without fixed rows the field names come from the
+            # answers, so a new answer can add a field.
+            self.question.clear_field_names()
 
     def __unicode__(self):
         if self.respondant and self.question:
@@ -569,9 +734,41 @@ class Response(caching.base.CachingMixin, models.Model):
             return "No Respondant"
 
 
-def save_related(sender, instance, created, **kwargs):
-    # save the related objects on initial creation
-    if created:
-        instance.save_related()
+FLAT_ANSWER_TYPES = frozenset(['info', 'text', 'textarea', 'yes-no',
+                               'single-select', 'auto-single-select',
+                               'map-multipoint', 'pennies', 'timepicker',
+                               'multi-select'])
+NUMBER_TYPES = frozenset(['currency', 'integer', 'number'])
+SINGLE_SELECT_TYPES = frozenset(['auto-single-select', 'single-select', 'yes-no'])
+MULTI_SELECT_TYPES = frozenset(['auto-multi-select', 'multi-select'])
+MAP_TYPES = frozenset(['map-multipoint', 'pennies'])
+# Grid column types stored as one GridAnswer per cell.
+GRID_VALUE_TYPES = frozenset(['currency', 'integer', 'number',
+                              'single-select', 'text', 'yes-no'])
+
+# Question type -> Response method, looked up once per response instead
+# of walking an if/elif chain.
+FLAT_HANDLERS = {'datepicker': Response._flat_date, 'grid': Response._flat_grid}
+FLAT_HANDLERS.update(dict.fromkeys(FLAT_ANSWER_TYPES, Response._flat_answer))
+FLAT_HANDLERS.update(dict.fromkeys(NUMBER_TYPES, Response._flat_number))
+
+SAVE_HANDLERS = {'datepicker': Response._save_date, 'grid': Response._save_grid}
+SAVE_HANDLERS.update(dict.fromkeys(NUMBER_TYPES, Response._save_number))
+SAVE_HANDLERS.update(dict.fromkeys(SINGLE_SELECT_TYPES, Response._save_single_select))
+SAVE_HANDLERS.update(dict.fromkeys(MULTI_SELECT_TYPES, Response._save_multi_select))
+SAVE_HANDLERS.update(dict.fromkeys(MAP_TYPES, Response._save_map))
+
+
+def clear_page_field_names(sender, instance, **kwargs):
+    if instance.survey_id is not None:
+        cache.delete(FIELD_NAMES_KEY % instance.survey_id)
+
+signals.post_save.connect(clear_page_field_names, sender=Page)
+signals.post_delete.connect(clear_page_field_names, sender=Page)
+
+
+def clear_survey_stats(sender, instance, **kwargs):
+    cache.delete(STATS_KEY % (instance.survey_id, datetime.date.today()))
 
-signals.post_save.connect(save_related, sender=Response)
+signals.post_save.connect(clear_survey_stats, sender=Respondant)
+signals.post_delete.connect(clear_survey_stats, sender=Respondant)
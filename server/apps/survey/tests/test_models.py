@@ -0,0 +1,168 @@
+import datetime
+import json
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils.timezone import utc
+
+from ..models import (GridAnswer, Location, LocationAnswer, MultiAnswer,
+                      Page, Question, Respondant, Response, Survey,
+                      REVIEW_STATE_FLAGGED, REVIEW_STATE_NEEDED)
+
+
+class TestSurveyStats(TestCase):
+    fixtures = ['reef.json', 'users.json']
+
+    def setUp(self):
+        self.survey = Survey.objects.get(slug='reef-fish-market-survey')
+        self.user = User.objects.get(username='superuser_alpha')
+        Respondant(survey=self.survey, surveyor=self.user, complete=True,
+                   review_status=REVIEW_STATE_FLAGGED,
+                   ts=datetime.datetime.utcnow().replace(tzinfo=utc)).save()
+
+    def test_dashboard_stats_match_counts(self):
+        respondants = Respondant.objects.filter(survey=self.survey)
+        stats = self.survey.dashboard_stats()
+        self.assertEqual(stats['survey_responses'], respondants.count())
+        self.assertEqual(stats['completes'],
+                         respondants.filter(complete=True).count())
+        self.assertEqual(stats['reviews_needed'],
+                         respondants.filter(review_status=REVIEW_STATE_NEEDED).count())
+        self.assertEqual(stats['flagged'],
+                         respondants.filter(review_status=REVIEW_STATE_FLAGGED).count())
+        self.assertGreaterEqual(stats['today'], 1)
+
+    def test_cached_stats_cleared_by_new_respondant(self):
+        before = Survey.objects.get(pk=self.survey.pk).survey_responses
+        Respondant(survey=self.survey,
+                   ts=datetime.datetime.utcnow().replace(tzinfo=utc)).save()
+        after = Survey.objects.get(pk=self.survey.pk).survey_responses
+        self.assertEqual(after, before + 1)
+
+
+class TestSaveRelated(TestCase):
+    fixtures = ['reef.json', 'users.json']
+
+    def setUp(self):
+        self.survey = Survey.objects.get(slug='reef-fish-market-survey')
+        self.respondant = Respondant(survey=self.survey,
+                                     ts=datetime.datetime.utcnow().replace(tzinfo=utc))
+        self.respondant.save(update_csv=False)
+
+    def answer(self, question, value, response=None):
+        # Mirrors the answer view: created responses run save_related from
+        # save(), existing ones are saved and then save_related is called.
+        if response is None:
+            response = Response(question=question, respondant=self.respondant,
+                                answer_raw=json.dumps(value))
+            response.save()
+        else:
+            response.answer_raw = json.dumps(value)
+            response.save()
+            response.save_related()
+        return response
+
+    def csv_data(self):
+        respondant = Respondant.objects.no_cache().get(pk=self.respondant.pk)
+        return json.loads(respondant.csv_row.json_data)
+
+    def test_csv_row_filled_on_first_answer(self):
+        self.assertIsNone(self.respondant.csv_row.json_data)
+        question = self.survey.questions.get(slug='buy-or-catch')
+        self.answer(question, [{'text': 'Bought', 'label': 'bought'}])
+        self.assertEqual(self.csv_data()['buy-or-catch'], 'Bought')
+
+    def test_multi_select(self):
+        question = self.survey.questions.get(slug='buy-or-catch')
+        response = self.answer(question, [
+            {'text': 'Bought', 'label': 'bought'},
+            {'name': 'Caught', 'label': 'caught'},
+        ])
+        self.assertEqual(
+            list(MultiAnswer.objects.filter(response=response)
+                                    .order_by('pk')
+                                    .values_list('answer_text', 'answer_label')),
+            [('Bought', 'bought'), ('Caught', 'caught')])
+        self.assertEqual(Respondant.objects.get(pk=self.respondant.pk).buy_or_catch,
+                         'Bought, Caught')
+
+        self.answer(question, [{'text': 'Caught', 'label': 'caught'},
+                               {'text': None, 'label': 'blank'}],
+                    response=response)
+        self.assertEqual(
+            list(MultiAnswer.objects.filter(response=response)
+                                    .order_by('pk')
+                                    .values_list('answer_text', flat=True)),
+            ['Caught', ''])
+        self.assertEqual(Respondant.objects.get(pk=self.respondant.pk).buy_or_catch,
+                         'Caught, ')
+        self.assertEqual(self.csv_data()['buy-or-catch'], 'Caught, ')
+
+    def test_grid(self):
+        question = self.survey.questions.get(slug='activity-days')
+        response = self.answer(question, [
+            {'label': 'buy', 'text': 'Buy', 'days': 2},
+            # Not a number, and too big for the column; only these cells
+            # are dropped.
+            {'label': 'transport', 'text': 'Transport', 'days': 'lots'},
+            {'label': 'other', 'text': 'Other', 'days': 123456789012},
+        ])
+        rows = GridAnswer.objects.filter(response=response)
+        self.assertEqual(
+            list(rows.values_list('row_label', 'col_label', 'answer_number')),
+            [('buy', 'days', Decimal('2'))])
+        self.assertEqual(self.csv_data()['activity-days-buy'], '2')
+
+        self.answer(question, [{'label': 'transport', 'text': 'Transport', 'days': 3}],
+                    response=response)
+        rows = GridAnswer.objects.filter(response=response)
+        self.assertEqual(
+            list(rows.values_list('row_label', 'answer_number')),
+            [('transport', Decimal('3'))])
+        csv_data = self.csv_data()
+        self.assertEqual(csv_data['activity-days-transport'], '3')
+        self.assertNotIn('activity-days-buy', csv_data)
+
+    def test_map_multipoint(self):
+        question = Question.objects.create(title='Where do you fish?',
+                                           label='Fishing areas',
+                                           slug='fishing-areas',
+                                           type='map-multipoint')
+        Page.objects.create(survey=self.survey, question=question)
+        # Map answers are double encoded by the client.
+        response = self.answer(question, json.dumps([
+            {'lat': 1.5, 'lng': 2.5,
+             'answers': [[{'text': 'Reef', 'label': 'reef'}]]},
+            {'lat': 3.25, 'lng': 4.75,
+             'answers': [[{'text': 'Lagoon', 'label': 'lagoon'},
+                          {'text': 'Reef', 'label': 'reef'}]]},
+        ]))
+        locations = Location.objects.filter(response=response).order_by('pk')
+        self.assertEqual(
+            [(l.lat, l.lng, l.respondant_id) for l in locations],
+            [(Decimal('1.5'), Decimal('2.5'), self.respondant.pk),
+             (Decimal('3.25'), Decimal('4.75'), self.respondant.pk)])
+        self.assertEqual(
+            [list(LocationAnswer.objects.filter(location=l)
+                                        .order_by('pk')
+                                        .values_list('answer', 'label'))
+             for l in locations],
+            [[('Reef', 'reef')], [('Lagoon', 'lagoon'), ('Reef', 'reef')]])
+        self.assertTrue(self.csv_data()['fishing-areas'].startswith('1.5,2.5: '))
+        self.assertEqual(Respondant.objects.get(pk=self.respondant.pk).locations, 2)
+
+        self.answer(question, json.dumps([
+            {'lat': 5.0, 'lng': 6.0,
+             'answers': [[{'text': 'Mangrove', 'label': 'mangrove'}]]},
+        ]), response=response)
+        locations = Location.objects.filter(response=response)
+        self.assertEqual(locations.count(), 1)
+        self.assertEqual(
+            list(LocationAnswer.objects.filter(location__response=response)
+                                       .values_list('answer', flat=True)),
+            ['Mangrove'])
+        # The old points' answers went with them.
+        self.assertEqual(LocationAnswer.objects.count(), 1)
+        self.assertTrue(self.csv_data()['fishing-areas'].startswith('5.0,6.0: '))
+        self.assertEqual(Respondant.objects.get(pk=self.respondant.pk).locations, 1)
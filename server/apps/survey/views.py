@@ -65,7 +65,8 @@ def answer(request, survey_slug, question_slug, uuid):
         # if request.user and not respondant.surveyor:
         #     respondant.surveyor = request.user
         respondant.last_question = question_slug
-        respondant.save()
+        # save_related below rebuilds the CSV row once the answer is in.
+        respondant.save(update_csv=False)
 
         response, created = Response.objects.get_or_create(question=question, respondant=respondant)
         response.answer_raw = simplejson.dumps(simplejson.loads(request.POST.keys()[0]).get('answer', None))